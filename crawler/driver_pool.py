@@ -0,0 +1,130 @@
+import atexit
+import logging
+import queue
+import threading
+from typing import List
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+logger = logging.getLogger(__name__)
+
+
+def build_chrome_options() -> Options:
+    """
+    Собирает стандартный набор опций Chrome для краулера.
+
+    Returns:
+        Настроенный объект Options для headless-режима
+    """
+    chrome_options = Options()
+    # Запуск без графического интерфейса
+    chrome_options.add_argument("--headless")
+    # Отключение песочницы для снижения вероятности ошибок
+    chrome_options.add_argument("--no-sandbox")
+    # Уменьшает вероятность сбоев при нехватке памяти
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    # Для извлечения ссылок нужен только HTML: отключаем загрузку
+    # картинок, стилей и шрифтов - это основной сетевой вес страницы
+    chrome_options.add_experimental_option(
+        "prefs",
+        {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        },
+    )
+    # Не ждать дозагрузки подресурсов - достаточно готового DOM
+    chrome_options.page_load_strategy = "eager"
+    return chrome_options
+
+
+class WebDriverPool:
+    """
+    Пул переиспользуемых экземпляров Selenium WebDriver.
+
+    Особенности:
+    - Ленивое создание браузеров: не более size экземпляров,
+        и только когда они реально понадобились
+    - Выдача и возврат через acquire() / release()
+    - Амортизация многосекундного старта Chrome между страницами
+        и потоками
+    - Автоматическое завершение всех браузеров при выходе
+    """
+
+    def __init__(self, size: int = 3) -> None:
+        """
+        Инициализация пула.
+
+        Args:
+            size: Максимальное количество одновременно живущих браузеров
+
+        Attributes:
+            _available: Очередь свободных драйверов
+            _drivers: Все созданные драйверы (для завершения)
+        """
+        self._size = size
+        self._available: queue.Queue[webdriver.Chrome] = queue.Queue()
+        self._drivers: List[webdriver.Chrome] = []
+        self._lock = threading.Lock()
+        atexit.register(self.shutdown)
+
+    def acquire(self) -> webdriver.Chrome:
+        """
+        Выдает свободный драйвер, при необходимости создавая новый.
+
+        Блокируется, если все size браузеров уже заняты,
+        до возврата одного из них через release().
+
+        Returns:
+            Экземпляр webdriver.Chrome из пула
+        """
+        try:
+            return self._available.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._drivers) < self._size:
+                # keep_alive переиспользует одно HTTP-соединение к
+                # chromedriver вместо нового TCP-рукопожатия на каждую
+                # WebDriver-команду (get, find_element, page_source...)
+                driver = webdriver.Chrome(
+                    options=build_chrome_options(), keep_alive=True
+                )
+                self._drivers.append(driver)
+                return driver
+
+        # Лимит достигнут - ждем возврата занятого драйвера
+        return self._available.get()
+
+    def release(self, driver: webdriver.Chrome) -> None:
+        """
+        Возвращает драйвер в пул для переиспользования.
+
+        Args:
+            driver: Драйвер, полученный ранее через acquire()
+        """
+        self._available.put(driver)
+
+    def shutdown(self) -> None:
+        """
+        Завершает работу всех созданных браузеров.
+
+        Вызывается автоматически через atexit, повторные вызовы
+        безопасны.
+        """
+        with self._lock:
+            for driver in self._drivers:
+                try:
+                    driver.quit()
+                except Exception as e:
+                    logging.warning(f"Ошибка при завершении драйвера: {e}")
+            self._drivers.clear()
+
+        # Очищаем очередь свободных драйверов
+        while True:
+            try:
+                self._available.get_nowait()
+            except queue.Empty:
+                break
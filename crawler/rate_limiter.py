@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """
+    Асинхронный ограничитель частоты запросов по схеме "token bucket".
+
+    Особенности:
+    - Ограничивает именно сетевые запросы в секунду, а не темп
+        диспетчеризации URL
+    - Токены пополняются непрерывно, накапливаясь до полного ведра,
+        поэтому короткие всплески проходят без ожидания
+    - Используется как асинхронный контекстный менеджер
+    """
+
+    def __init__(self, rate: float = 5.0, per: float = 1.0) -> None:
+        """
+        Инициализация ограничителя.
+
+        Args:
+            rate: Количество разрешенных запросов за интервал
+            per: Длительность интервала в секундах
+        """
+        self.rate = rate
+        self.per = per
+        self._allowance = rate
+        self._last_check = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """
+        Дожидается свободного токена и расходует его.
+
+        Если ведро пусто, задача засыпает ровно до момента появления
+        следующего токена - без активного ожидания.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._allowance = min(
+                    self.rate,
+                    self._allowance + (now - self._last_check) * (self.rate / self.per),
+                )
+                self._last_check = now
+
+                if self._allowance >= 1.0:
+                    self._allowance -= 1.0
+                    return
+
+                await asyncio.sleep((1.0 - self._allowance) / (self.rate / self.per))
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type: object, exc: object, tb: object) -> None:
+        return None
@@ -1,16 +1,20 @@
+import asyncio
 import logging
-import threading
-import time
-from concurrent.futures import ThreadPoolExecutor
-from typing import List, Optional, Set
-from urllib.parse import urljoin, urlparse
+import queue
+from typing import Dict, List, Optional, Set
+from urllib.robotparser import RobotFileParser
 
+import aiohttp
 from bs4 import BeautifulSoup
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from yarl import URL
+
+from crawler.driver_pool import WebDriverPool
+from crawler.rate_limiter import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -20,50 +24,119 @@ class SiteCrawler:
     Web-crawler для сканирования сайтов и сбора ссылок.
 
     Особенности:
-    - Обработка страниц в много поточном режиме
-    - Поддержка сайтов с загрузкой контента
-        через JavaScript с помощью Selenium
+    - Быстрая асинхронная загрузка страниц через aiohttp
+        (сотни одновременных запросов в одном event loop)
+    - Резервная загрузка через Selenium только для страниц,
+        которым требуется выполнение JavaScript
+    - Учет запретов robots.txt при пополнении очереди обхода
     - Защита от дубликатов и зацикливания
     """
 
-    def __init__(self, start_url: str) -> None:
+    def __init__(
+        self,
+        start_url: str,
+        max_workers: int = 3,
+        requests_per_second: float = 5.0,
+    ) -> None:
         """
         Инициализация краулера.
 
         Args:
             start_url: Список начальных URL для сканирования
+            max_workers: Максимальное количество одновременно
+                работающих браузеров для JS-страниц
+            requests_per_second: Лимит запросов к целевому серверу
 
         Attributes:
             visited: Множество уже обработанных URL
-            to_visit: Очередь URL для обработки
+            to_visit: Потокобезопасная очередь URL для обработки
             found_links: Список всех найденных уникальных ссылок
-            lock: Блокировка для потокобезопасности
-            driver: Selenium WebDriver для работы с JavaScript
+            pool: Пул Selenium WebDriver для страниц с JavaScript
+
+        Вместо глобальной блокировки используются структуры, атомарные
+        под GIL: dict.setdefault для дедупликации, set.add и
+        list.append для публикации результатов, queue.Queue для
+        очереди обхода.
         """
         self.visited: Set[str] = set()
-        self.to_visit: List[str] = [start_url]
+        self.to_visit: "queue.Queue[str]" = queue.Queue()
+        self.to_visit.put(start_url)
         self.found_links: List[str] = []
-        self.lock: threading.Lock = threading.Lock()
-
-        # Настройка Selenium WebDriver для работы в фоновом режиме
-        chrome_options = Options()
-        # Запуск без графического интерфейса
-        chrome_options.add_argument("--headless")
-        # Отключение песочницы для снижения вероятности ошибок
-        chrome_options.add_argument("--no-sandbox")
-        # Уменьшает вероятность сбоев при нехватке памяти
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        # Инициализация web driver
-        self.driver: webdriver.Chrome = webdriver.Chrome(options=chrome_options)
+        # Индекс всех когда-либо встреченных URL. Значение - уникальный
+        # токен вставки, чтобы setdefault мог отличить "вставил я"
+        # от "уже было" за одну атомарную операцию
+        self._seen: Dict[str, object] = {start_url: object()}
+
+        # robots.txt загружается один раз в начале обхода;
+        # None означает "файл не загружен - разрешено все"
+        self._robots_url: str = str(URL(start_url).with_path("/robots.txt"))
+        self._robots: Optional[RobotFileParser] = None
+
+        # Пул браузеров создает экземпляры лениво - только если
+        # встретится страница, требующая выполнения JavaScript
+        self.pool: WebDriverPool = WebDriverPool(size=max_workers)
+
+        # Ограничитель нагрузки на целевой сервер: лимитируются
+        # сами сетевые запросы, а не темп выборки URL из очереди
+        self.rate_limiter: AsyncRateLimiter = AsyncRateLimiter(rate=requests_per_second)
+
+    async def fetch_page_async(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> Optional[str]:
+        """
+        Асинхронно загружает содержимое веб-страницы без браузера.
+
+        Быстрый путь: обычный HTTP-запрос через aiohttp вместо
+        полноценного Chrome. Подходит для страниц, отдающих
+        готовый HTML без рендеринга JavaScript.
+
+        Args:
+            session: Общая aiohttp-сессия с пулом соединений
+            url: URL страницы для загрузки
+
+        Returns:
+            HTML-код страницы или None в случае ошибки
+        """
+        try:
+            timeout = aiohttp.ClientTimeout(total=10)
+            async with session.get(url, timeout=timeout) as response:
+                if response.status != 200:
+                    logging.warning(f"Статус {response.status} для {url}")
+                    return None
+                return await response.text()
+        except Exception as e:
+            logging.error(f"Не удалось загрузить {url}: {e}")
+            return None
+
+    async def _load_robots(self, session: aiohttp.ClientSession) -> None:
+        """
+        Загружает и разбирает robots.txt сайта.
+
+        Вызывается один раз в начале обхода. Если файл недоступен
+        или отдал не-200, ограничения не применяются - как и раньше,
+        краулер обходит все внутренние ссылки.
+
+        Args:
+            session: Общая aiohttp-сессия с пулом соединений
+        """
+        async with self.rate_limiter:
+            text = await self.fetch_page_async(session, self._robots_url)
+        if text is not None:
+            parser = RobotFileParser()
+            parser.parse(text.splitlines())
+            self._robots = parser
 
     def fetch_page(self, url: str) -> Optional[str]:
         """
         Загружает содержимое веб-страницы с выполнением JavaScript.
 
+        Используется как резервный вариант, когда быстрая загрузка
+        через aiohttp не вернула ссылок (контент строится скриптами).
+
         Процесс:
         1. Переход по указанному URL
         2. Ожидание загрузки DOM
-        3. Дополнительное время для выполнения JavaScript
+        3. Явное ожидание полной готовности документа и появления ссылок
         4. Возврат итогового HTML
 
         Args:
@@ -73,20 +146,38 @@ class SiteCrawler:
             HTML-код страницы или None в случае ошибки
         """
 
+        driver: Optional[webdriver.Chrome] = None
         try:
-            self.driver.get(url)
+            # Получение драйвера тоже под try: ленивый первый запуск
+            # Chrome может упасть, и это такая же ошибка загрузки
+            driver = self.pool.acquire()
+            driver.get(url)
             # Ожидание загрузки содержимого body
-            WebDriverWait(self.driver, 10).until(
+            WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
-            # Дополнительная пауза для выполнения JavaScript
-            time.sleep(2)
-            return self.driver.page_source
+            # Явное ожидание вместо фиксированной паузы: возвращает
+            # управление сразу, как только документ полностью готов
+            WebDriverWait(driver, 10).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+            try:
+                # Дожидаемся появления ссылок, построенных JavaScript
+                WebDriverWait(driver, 5).until(
+                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, "a[href]"))
+                )
+            except TimeoutException:
+                # На странице может вообще не быть ссылок - это не ошибка
+                pass
+            return driver.page_source
         except Exception as e:
             logging.error(f"Не удалось загрузить {url}: {e}")
             return None
+        finally:
+            if driver is not None:
+                self.pool.release(driver)
 
-    def extract_links(self, url: str, html: str) -> None:
+    def extract_links(self, url: str, html: str) -> int:
         """
         Извлекает все ссылки со страницы и добавляет их в очередь для обработки.
 
@@ -102,58 +193,71 @@ class SiteCrawler:
                  относительных ссылок в абсолютные
             html: HTML-код страницы для парсинга
 
+        Returns:
+            Количество тегов <a href> на странице (до фильтрации);
+            0 означает, что контент скорее всего строится JavaScript
+
         Фильтрация ссылок:
             - Отсеиваются не-HTTP/HTTPS схемы (mailto:, javascript:, tel: и т.д.)
             - Игнорируются якорные ссылки, ведущие на ту же страницу (#section)
+            - Отсеиваются URL, запрещенные robots.txt (если он загружен)
             - Опционально можно ограничиться только основным доменом
         """
 
-        soup = BeautifulSoup(html, "html.parser")
-        base_domain = urlparse(url).netloc
-        current_page_path = urlparse(url).path
-
-        for anchor in soup.find_all("a", href=True):
+        # lxml - парсер на C, в разы быстрее чистопитоновского
+        # html.parser; select() использует скомпилированный CSS-селектор
+        soup = BeautifulSoup(html, "lxml")
+        # yarl.URL - разбор и склейка URL на C, в разы быстрее
+        # чистопитоновских urljoin/urlparse в цикле по ссылкам.
+        # Базовый URL разбирается один раз на страницу
+        base = URL(url)
+        base_host = base.host
+        current_page_path = base.path
+
+        anchors = soup.select("a[href]")
+        for anchor in anchors:
             href_value = anchor.get("href")
             if not href_value or not isinstance(href_value, str):
                 continue
 
-            link: str = href_value
-            full_url: str = urljoin(url, link)
-            parsed = urlparse(full_url)
+            try:
+                full = base.join(URL(href_value))
+            except ValueError:
+                # Битый href - пропускаем
+                continue
 
             # 1. Фильтруем не-HTTP ссылки
-            if parsed.scheme not in ("http", "https"):
+            if full.scheme not in ("http", "https"):
                 continue
 
             # 2. Фильтруем якорные ссылки.
             # Пропускаем если: есть фрагмент И тот же домен И тот же путь
-            # urlparse("scheme://netloc/path;parameters?query#fragment")
-            # ParseResult(
-            #            scheme='scheme', netloc='netloc',
-            #            path='/path;parameters', params='',
-            #            query='query', fragment='fragment'
-            #            )
             if (
-                parsed.fragment
-                and parsed.netloc == base_domain
-                and parsed.path == current_page_path
+                full.fragment
+                and full.host == base_host
+                and full.path == current_page_path
             ):
                 continue
 
             # 3. Ограничиваемся только основным доменом
-            if parsed.netloc != base_domain:
+            if full.host != base_host:
                 continue
 
-            # Потокобезопасное добавление
-            with self.lock:
-                if (
-                    full_url not in self.visited
-                    and full_url not in self.to_visit
-                    and full_url not in self.found_links
-                ):
-                    self.found_links.append(full_url)
-                    self.to_visit.append(full_url)
-                    logging.info(f"Найдена ссылка: {full_url}")
+            full_url: str = str(full)
+
+            # 4. Уважаем запреты robots.txt, если файл был загружен
+            if self._robots is not None and not self._robots.can_fetch("*", full_url):
+                continue
+
+            # Лок-фри добавление: dict.setdefault атомарен под GIL,
+            # поэтому ровно один поток "выигрывает" вставку нового URL
+            token = object()
+            if self._seen.setdefault(full_url, token) is token:
+                self.found_links.append(full_url)
+                self.to_visit.put(full_url)
+                logging.info(f"Найдена ссылка: {full_url}")
+
+        return len(anchors)
 
     def process_page(self, url: str) -> None:
         """
@@ -174,45 +278,117 @@ class SiteCrawler:
         if html:
             self.extract_links(url, html)
 
-        with self.lock:
-            self.visited.add(url)
+        # set.add атомарен под GIL - блокировка не нужна
+        self.visited.add(url)
 
-    def crawl(self) -> List[str]:
+    async def process_page_async(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> None:
         """
-        Метод для запуска процесса сканирования сайта.
+        Асинхронная обработка страницы: загрузка контента и извлечение ссылок.
+
+        Сначала пробует быструю загрузку через aiohttp; если страница
+        загрузилась, но не отдала ни одной ссылки, перезагружает ее
+        через Selenium (браузер берется из общего пула WebDriverPool).
+        Ошибки загрузки (не-200, таймауты) в браузер не уходят - как
+        и раньше, такие страницы просто пропускаются. Страница
+        парсится один раз: extract_links заодно сообщает, были ли
+        на ней теги <a href>.
+
+        Args:
+            session: Общая aiohttp-сессия с пулом соединений
+            url: URL страницы для обработки
+        """
+        logging.info(f"Обрабатывается: {url}")
+
+        async with self.rate_limiter:
+            html: Optional[str] = await self.fetch_page_async(session, url)
+
+        anchors_found = self.extract_links(url, html) if html else 0
+
+        if html is not None and anchors_found == 0:
+            # Резервный путь: успешно загруженная страница без единой
+            # ссылки скорее всего строит контент JavaScript. Ошибка
+            # загрузки - не повод запускать браузер. Параллельность
+            # браузеров ограничена размером пула, повторный запрос
+            # тоже учитывается лимитером
+            async with self.rate_limiter:
+                html = await asyncio.to_thread(self.fetch_page, url)
+            if html:
+                self.extract_links(url, html)
+
+        # set.add атомарен под GIL - блокировка не нужна
+        self.visited.add(url)
+
+    async def crawl_async(self) -> List[str]:
+        """
+        Асинхронный запуск процесса сканирования сайта.
 
         Алгоритм работы:
-        1. Создание пула потоков
-        2. Обработка URL из очереди
-        3. Ограничение общего количества обрабатываемых страниц
-        4. Автоматическое добавление новых найденных ссылок в очередь
+        1. Создание общей aiohttp-сессии с пулом соединений
+        2. Разовая загрузка robots.txt сайта
+        3. Выборка очередной волны URL из очереди
+        4. Параллельная обработка волны через asyncio.gather
+            с ограничением одновременных запросов семафором
+        5. Автоматическое добавление новых найденных ссылок в очередь
 
         Returns:
             Список всех найденных уникальных ссылок
         """
 
         max_pages: int = 1000
+        # Ограничение количества одновременно обрабатываемых страниц
+        semaphore = asyncio.Semaphore(50)
+
+        async def process_with_limit(session: aiohttp.ClientSession, url: str) -> None:
+            async with semaphore:
+                await self.process_page_async(session, url)
+
+        connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # Разовая загрузка robots.txt: его запреты применяются
+            # при добавлении найденных ссылок в очередь
+            await self._load_robots(session)
+
+            while len(self.visited) < max_pages:
+                batch: List[str] = []
+
+                while len(self.visited) < max_pages:
+                    try:
+                        url = self.to_visit.get_nowait()
+                    except queue.Empty:
+                        break
+                    if url in self.visited:
+                        continue
+                    self.visited.add(url)
+                    batch.append(url)
+
+                if not batch:
+                    break
+
+                # return_exceptions: сбой одной страницы не обрывает
+                # волну и не теряет уже собранные ссылки
+                results = await asyncio.gather(
+                    *(process_with_limit(session, url) for url in batch),
+                    return_exceptions=True,
+                )
+                for page_url, result in zip(batch, results):
+                    if isinstance(result, Exception):
+                        logging.error(f"Ошибка обработки {page_url}: {result}")
+
+        # Браузеры из пула завершаются при выходе из процесса (atexit),
+        # поэтому здесь их не закрываем - они пригодятся следующему запуску
 
-        # Использование ThreadPoolExecutor для многопоточной обработки
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            while self.to_visit and len(self.visited) < max_pages:
-                url: Optional[str] = None
-
-                # Пока один поток работает со списком,
-                # другие потоки ждут, когда lock будет снят
-                with self.lock:
-                    if self.to_visit:
-                        url = self.to_visit.pop(0)
-                        if url in self.visited:
-                            continue
-                        self.visited.add(url)
+        return self.found_links
 
-                if url:
-                    executor.submit(self.process_page, url)
+    def crawl(self) -> List[str]:
+        """
+        Метод для запуска процесса сканирования сайта.
 
-                # Пауза для снижения нагрузки на целевой сервер
-                time.sleep(1)
+        Синхронная обертка над crawl_async для удобного вызова
+        из обычного кода.
 
-        # Корректное завершение работы WebDriver
-        self.driver.quit()
-        return self.found_links
+        Returns:
+            Список всех найденных уникальных ссылок
+        """
+        return asyncio.run(self.crawl_async())
@@ -0,0 +1,91 @@
+from unittest.mock import Mock, patch
+
+from crawler.driver_pool import WebDriverPool
+
+
+def test_pool_lazy_creation() -> None:
+    """
+    Тест ленивого создания браузеров в пуле.
+
+    Проверяет:
+    - Браузер не создается при инициализации пула
+    - Браузер создается только при первом acquire()
+    """
+    with patch("crawler.driver_pool.webdriver.Chrome") as mock_chrome:
+        mock_chrome.return_value = Mock()
+
+        pool = WebDriverPool(size=2)
+
+        # До первого acquire() браузеров нет
+        mock_chrome.assert_not_called()
+
+        pool.acquire()
+
+        # После acquire() создан ровно один браузер
+        mock_chrome.assert_called_once()
+
+
+def test_pool_reuses_released_driver() -> None:
+    """
+    Тест переиспользования возвращенного драйвера.
+
+    Проверяет:
+    - release() возвращает драйвер в пул
+    - Повторный acquire() выдает тот же экземпляр без создания нового
+    """
+    with patch("crawler.driver_pool.webdriver.Chrome") as mock_chrome:
+        mock_chrome.return_value = Mock()
+
+        pool = WebDriverPool(size=2)
+
+        driver = pool.acquire()
+        pool.release(driver)
+
+        # Тот же драйвер выдается повторно
+        assert pool.acquire() is driver
+        mock_chrome.assert_called_once()
+
+
+def test_pool_respects_size_limit() -> None:
+    """
+    Тест ограничения размера пула.
+
+    Проверяет:
+    - Пул создает не более size браузеров
+    - Разные acquire() выдают разные экземпляры в пределах лимита
+    """
+    with patch("crawler.driver_pool.webdriver.Chrome") as mock_chrome:
+        mock_chrome.side_effect = lambda **kwargs: Mock()
+
+        pool = WebDriverPool(size=2)
+
+        first = pool.acquire()
+        second = pool.acquire()
+
+        assert first is not second
+        assert mock_chrome.call_count == 2
+
+
+def test_pool_shutdown_quits_drivers() -> None:
+    """
+    Тест завершения работы пула.
+
+    Проверяет:
+    - shutdown() вызывает quit() у всех созданных браузеров
+    - Повторный shutdown() безопасен
+    """
+    with patch("crawler.driver_pool.webdriver.Chrome") as mock_chrome:
+        mock_driver = Mock()
+        mock_chrome.return_value = mock_driver
+
+        pool = WebDriverPool(size=1)
+        driver = pool.acquire()
+        pool.release(driver)
+
+        pool.shutdown()
+
+        mock_driver.quit.assert_called_once()
+
+        # Повторный вызов не падает и не закрывает драйвер еще раз
+        pool.shutdown()
+        mock_driver.quit.assert_called_once()
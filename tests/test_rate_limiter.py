@@ -0,0 +1,48 @@
+import asyncio
+import time
+
+from crawler.rate_limiter import AsyncRateLimiter
+
+
+def test_rate_limiter_allows_burst() -> None:
+    """
+    Тест пропуска всплеска в пределах ведра.
+
+    Проверяет:
+    - Запросы в пределах rate проходят без заметной задержки
+    """
+    limiter = AsyncRateLimiter(rate=10.0, per=1.0)
+
+    async def run() -> float:
+        start = time.monotonic()
+        for _ in range(5):
+            async with limiter:
+                pass
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(run())
+
+    assert elapsed < 0.1
+
+
+def test_rate_limiter_throttles_over_limit() -> None:
+    """
+    Тест замедления при превышении лимита.
+
+    Проверяет:
+    - Запросы сверх емкости ведра ждут пополнения токенов
+    """
+    # 5 токенов в ведре, пополнение 50 токенов/с
+    limiter = AsyncRateLimiter(rate=5.0, per=0.1)
+
+    async def run() -> float:
+        start = time.monotonic()
+        for _ in range(8):
+            async with limiter:
+                pass
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(run())
+
+    # Три запроса сверх ведра ждут ~0.02 с каждый
+    assert elapsed >= 0.04
@@ -1,4 +1,6 @@
-from unittest.mock import Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from urllib.robotparser import RobotFileParser
 
 from crawler.site_crawler import SiteCrawler
 
@@ -10,15 +12,13 @@ def test_site_crawler_initialization() -> None:
     Проверяет:
     - Корректность установки начального URL
     - Инициализацию базовых атрибутов
-    - Наличие блокировки для потокобезопасности
     """
     crawler = SiteCrawler("https://example.com")
 
     # Проверяем базовые атрибуты
-    assert crawler.to_visit == ["https://example.com"]
+    assert list(crawler.to_visit.queue) == ["https://example.com"]
     assert crawler.visited == set()
     assert crawler.found_links == []
-    assert hasattr(crawler, "lock")
 
 
 def test_crawler_extract_links_basic() -> None:
@@ -69,6 +69,8 @@ def test_crawler_fetch_page_success() -> None:
     with patch("crawler.site_crawler.webdriver.Chrome") as mock_chrome:
         mock_driver = Mock()
         mock_driver.page_source = "<html>Test content</html>"
+        # Документ сразу сообщает о полной готовности
+        mock_driver.execute_script.return_value = "complete"
         mock_chrome.return_value = mock_driver
 
         crawler = SiteCrawler("https://example.com")
@@ -140,7 +142,7 @@ def test_crawler_thread_safety() -> None:
 
     Проверяет:
     - Отсутствие дубликатов при многократном вызове
-    - Корректность работы блокировки
+    - Корректность атомарной дедупликации через dict.setdefault
     - Сохранение уникальности ссылок
     """
     with patch("crawler.site_crawler.webdriver.Chrome") as mock_chrome:
@@ -158,3 +160,93 @@ def test_crawler_thread_safety() -> None:
         # Должна быть только одна ссылка (без дубликатов)
         assert len(crawler.found_links) == 1
         assert crawler.found_links[0] == "https://example.com/test"
+
+
+def test_crawler_fetch_page_async_success() -> None:
+    """
+    Тест успешной асинхронной загрузки страницы.
+
+    Проверяет:
+    - Загрузку HTML через aiohttp-сессию без браузера
+    - Возврат текста ответа при статусе 200
+    """
+    crawler = SiteCrawler("https://example.com")
+
+    response = MagicMock()
+    response.status = 200
+    response.text = AsyncMock(return_value="<html>Async content</html>")
+
+    session = MagicMock()
+    session.get.return_value.__aenter__.return_value = response
+
+    result = asyncio.run(crawler.fetch_page_async(session, "https://example.com"))
+
+    assert result == "<html>Async content</html>"
+
+
+def test_crawler_fetch_page_async_failure() -> None:
+    """
+    Тест неудачной асинхронной загрузки страницы.
+
+    Проверяет:
+    - Обработку исключений при запросе
+    - Возврат None при ошибках
+    """
+    crawler = SiteCrawler("https://example.com")
+
+    session = MagicMock()
+    session.get.side_effect = Exception("Connection error")
+
+    result = asyncio.run(crawler.fetch_page_async(session, "https://example.com"))
+
+    assert result is None
+
+
+def test_crawler_extract_links_returns_anchor_count() -> None:
+    """
+    Тест подсчета тегов <a href> в extract_links.
+
+    Проверяет:
+    - Возврат количества тегов до фильтрации
+    - Ноль для страницы без единой ссылки (признак JS-контента)
+    """
+    crawler = SiteCrawler("https://example.com")
+
+    html_with_links = """
+    <html><body>
+        <a href="/page">Page</a>
+        <a href="https://external.com/page">External</a>
+    </body></html>
+    """
+    html_without_links = "<html><body><noscript>Enable JS</noscript></body></html>"
+
+    assert crawler.extract_links("https://example.com", html_with_links) == 2
+    assert crawler.extract_links("https://example.com", html_without_links) == 0
+
+
+def test_crawler_respects_robots_txt() -> None:
+    """
+    Тест учета запретов robots.txt при извлечении ссылок.
+
+    Проверяет:
+    - Запрещенные robots.txt URL не попадают в найденные ссылки
+    - Разрешенные URL обрабатываются как обычно
+    - Без загруженного robots.txt ограничения не применяются
+    """
+    crawler = SiteCrawler("https://example.com")
+
+    html = """
+    <html><body>
+        <a href="/private/page">Private</a>
+        <a href="/public/page">Public</a>
+    </body></html>
+    """
+
+    parser = RobotFileParser()
+    parser.parse(["User-agent: *", "Disallow: /private/"])
+    crawler._robots = parser
+
+    crawler.extract_links("https://example.com", html)
+
+    assert "https://example.com/public/page" in crawler.found_links
+    assert "https://example.com/private/page" not in crawler.found_links
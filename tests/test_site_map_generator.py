@@ -1,3 +1,4 @@
+import gzip
 import tempfile
 from pathlib import Path
 
@@ -196,3 +197,83 @@ def test_sitemap_filter_external_urls() -> None:
 
     finally:
         Path(temp_file).unlink(missing_ok=True)
+
+
+def test_sitemap_no_double_escaping() -> None:
+    """
+    Тест отсутствия двойного экранирования URL.
+
+    Проверяет:
+    - Амперсанд в URL сериализуется как &amp; ровно один раз
+    - В файле нет артефактов вида &amp;amp;
+    """
+    generator = SitemapGenerator("https://example.com")
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
+        temp_file = f.name
+
+    try:
+        urls = ["https://example.com/search?q=a&page=2"]
+        result_file = generator.generate_sitemap(urls, temp_file)
+
+        with open(result_file, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        assert "q=a&amp;page=2" in content
+        assert "&amp;amp;" not in content
+
+    finally:
+        Path(temp_file).unlink(missing_ok=True)
+
+
+def test_sitemap_generate_index_chunks() -> None:
+    """
+    Тест генерации sitemap-индекса с разбивкой на части.
+
+    Проверяет:
+    - Разбивку списка URL на сжатые файлы по max_urls_per_file
+    - Создание индексного файла со ссылками на все части
+    - Попадание всех URL в части
+    """
+    generator = SitemapGenerator("https://example.com")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        urls = [f"https://example.com/page{i}" for i in range(5)]
+
+        index_file = generator.generate_sitemap_index(
+            urls, output_dir=temp_dir, max_urls_per_file=2
+        )
+
+        # Индексный файл создан
+        assert Path(index_file).exists()
+
+        with open(index_file, "r", encoding="utf-8") as f:
+            index_content = f.read()
+
+        # 5 URL по 2 на файл = 3 части
+        chunk_names = [f"sitemap-{i:04d}.xml.gz" for i in range(1, 4)]
+        for name in chunk_names:
+            assert name in index_content
+            assert (Path(temp_dir) / name).exists()
+
+        # Все URL попали в части
+        content = ""
+        for name in chunk_names:
+            with gzip.open(Path(temp_dir) / name, "rt", encoding="utf-8") as gz:
+                content += gz.read()
+
+        for url in urls:
+            assert url in content
+
+
+def test_sitemap_generate_index_empty_urls() -> None:
+    """
+    Тест генерации индекса с пустым списком URL.
+
+    Проверяет:
+    - Вызов исключения при пустом списке URL
+    """
+    generator = SitemapGenerator("https://example.com")
+
+    with pytest.raises(ValueError, match="Список URL не может быть пустым"):
+        generator.generate_sitemap_index([])